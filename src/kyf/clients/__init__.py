@@ -2,4 +2,9 @@ from kyf.clients.base import AbstractMoltbookClient
 from kyf.clients.llm_client import LLMClient, GroqClient
 from kyf.clients.moltbook_client import MoltbookClient
 
-__all__ = ["AbstractMoltbookClient", "MoltbookClient", "LLMClient", "GroqClient"]
+__all__ = [
+    "AbstractMoltbookClient",
+    "MoltbookClient",
+    "LLMClient",
+    "GroqClient",
+]
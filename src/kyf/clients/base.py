@@ -5,6 +5,7 @@ abstractions, not on concrete HTTP/API implementations.
 """
 
 from abc import ABC, abstractmethod
+from typing import Any
 
 from kyf.models.moltbook import (
     AgentProfile,
@@ -37,9 +38,28 @@ class AbstractMoltbookClient(ABC):
         self, sort: PostSortOrder = PostSortOrder.HOT, limit: int = 25
     ) -> list[Post]: ...
 
+    @abstractmethod
+    async def get_posts_raw(
+        self, sort: PostSortOrder = PostSortOrder.HOT, submolt: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Unvalidated post dicts — lets callers drop posts before paying for validation."""
+        ...
+
+    @abstractmethod
+    async def get_feed_raw(
+        self, sort: PostSortOrder = PostSortOrder.HOT, limit: int = 25
+    ) -> list[dict[str, Any]]:
+        """Unvalidated personalized-feed post dicts."""
+        ...
+
     @abstractmethod
     async def get_post(self, post_id: str) -> Post: ...
 
+    @abstractmethod
+    async def get_posts_bulk(self, post_ids: list[str]) -> dict[str, Post]:
+        """Posts by ID, fetched concurrently; IDs that fail to load are omitted."""
+        ...
+
     @abstractmethod
     async def create_post(self, request: CreatePostRequest) -> Post: ...
 
@@ -53,6 +73,13 @@ class AbstractMoltbookClient(ABC):
         self, post_id: str, sort: CommentSortOrder = CommentSortOrder.TOP
     ) -> list[Comment]: ...
 
+    @abstractmethod
+    async def get_comments_bulk(
+        self, post_ids: list[str], sort: CommentSortOrder = CommentSortOrder.TOP
+    ) -> dict[str, list[Comment]]:
+        """Comments per post ID, fetched concurrently; IDs that fail to load are omitted."""
+        ...
+
     @abstractmethod
     async def create_comment(self, request: CreateCommentRequest) -> Comment: ...
 
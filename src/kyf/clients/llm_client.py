@@ -4,25 +4,41 @@ Defines an abstract interface so the agent doesn't depend on a specific LLM prov
 GroqClient is the concrete implementation for Groq's inference API.
 """
 
+import asyncio
+import functools
+import hashlib
 import json
-import logging
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
 
-from groq import AsyncGroq, RateLimitError
+import orjson
+from cachetools import TTLCache
+from groq import AsyncGroq, DefaultAsyncHttpxClient, RateLimitError
 from pydantic import SecretStr
-from tenacity import (
-    before_sleep_log,
-    retry,
-    retry_if_not_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
 
 from kyf.logger import get_logger
 from kyf.models.llm import LLMConfig
 
 logger = get_logger(__name__)
-_std_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Retry policy for transient provider errors: delays of 1s, 2s, ... capped at 10s
+_MAX_ATTEMPTS = 3
+_MAX_BACKOFF = 10.0
+
+_JSON_INSTRUCTION = "Respond ONLY with valid JSON, no markdown or extra text."
+
+# Cooldowns longer than this are a quota wall, not a blip — fail fast instead of sleeping
+_MAX_COOLDOWN_WAIT = 30.0
+
+
+@functools.lru_cache(maxsize=32)
+def _json_system_prompt(system_prompt: str) -> str:
+    """System prompts are a handful of constants — join each with the JSON instruction once."""
+    return f"{system_prompt}\n\n{_JSON_INSTRUCTION}"
 
 
 class LLMRateLimitError(Exception):
@@ -49,13 +65,94 @@ class LLMClient(ABC):
         """Generate a structured JSON response."""
         ...
 
+    async def close(self) -> None:
+        """Release network resources. No-op unless the provider holds any."""
+
+
+class LLMCache:
+    """Mixin adding an in-process LRU+TTL response cache to LLM clients.
+
+    Only deterministic calls (temperature == 0, i.e. GROQ_TEMPERATURE=0) are
+    cached — sampled responses are supposed to differ between calls. Raw response text is
+    stored so callers never share a mutable parsed object.
+    """
+
+    _config: LLMConfig
+
+    def _init_cache(self, maxsize: int = 1024, ttl: float = 3600) -> None:
+        self._cache: TTLCache[str, str] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._cache_lock = asyncio.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def _cache_key(self, system_prompt: str, user_prompt: str, as_json: bool) -> str | None:
+        """Return the cache key for a call, or None if the call isn't cacheable."""
+        if self._config.temperature != 0:
+            return None
+        payload = json.dumps(
+            {
+                "model": self._config.model,
+                "t": self._config.temperature,
+                "sys": system_prompt,
+                "usr": user_prompt,
+                "json": as_json,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def _cache_get(self, key: str | None) -> str | None:
+        if key is None:
+            return None
+        async with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                self.stats["misses"] += 1
+            else:
+                self.stats["hits"] += 1
+            return cached
+
+    async def _cache_put(self, key: str | None, value: str) -> None:
+        if key is None:
+            return
+        async with self._cache_lock:
+            self._cache[key] = value
+
 
-class GroqClient(LLMClient):
+class GroqClient(LLMCache, LLMClient):
     """Concrete LLM client using Groq inference API."""
 
     def __init__(self, api_key: SecretStr, config: LLMConfig | None = None) -> None:
         self._config = config or LLMConfig()
-        self._client = AsyncGroq(api_key=api_key.get_secret_value())
+        # HTTP/2 lets concurrent fact-checks share one TLS connection to Groq
+        self._client = AsyncGroq(
+            api_key=api_key.get_secret_value(),
+            http_client=DefaultAsyncHttpxClient(http2=True),
+        )
+        self._cooldown_until = 0.0
+        self._init_cache()
+        # Request options are fixed per client — build them once, not per call
+        self._text_options = {
+            "model": self._config.model,
+            "temperature": self._config.temperature,
+            "max_tokens": self._config.max_output_tokens,
+        }
+        self._json_options = {**self._text_options, "response_format": {"type": "json_object"}}
+
+    async def close(self) -> None:
+        await self._client.close()
+
+    async def _wait_for_cooldown(self) -> None:
+        """Honor the provider's last retry-after before sending another request."""
+        remaining = self._cooldown_until - time.monotonic()
+        if remaining <= 0:
+            return
+        if remaining > _MAX_COOLDOWN_WAIT:
+            raise LLMRateLimitError(
+                f"Still cooling down from rate limit ({remaining:.0f}s left)",
+                retry_after=remaining,
+            )
+        logger.debug("llm_cooldown_wait", seconds=round(remaining, 2))
+        await asyncio.sleep(remaining)
 
     def _handle_rate_limit(self, e: RateLimitError) -> None:
         """Convert Groq RateLimitError to our provider-agnostic LLMRateLimitError."""
@@ -67,24 +164,83 @@ class GroqClient(LLMClient):
                     retry_after = float(raw)
                 except ValueError:
                     pass
+        if retry_after is not None:
+            self._cooldown_until = time.monotonic() + retry_after
         raise LLMRateLimitError(str(e), retry_after=retry_after) from e
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(min=1, max=10),
-        retry=retry_if_not_exception_type(LLMRateLimitError),
-        before_sleep=before_sleep_log(_std_logger, logging.WARNING),
-    )
+    def _json_messages(self, system_prompt: str, user_prompt: str) -> list[dict[str, str]]:
+        """Build JSON-mode messages, keeping static text in the cacheable prefix.
+
+        Providers with automatic prefix caching reuse the leading byte-identical
+        tokens. With cache_system_prompt, the fixed JSON instruction joins the
+        system message instead of trailing the dynamic user prompt.
+        """
+        if self._config.cache_system_prompt:
+            return [
+                {"role": "system", "content": _json_system_prompt(system_prompt)},
+                {"role": "user", "content": user_prompt},
+            ]
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": f"{user_prompt}\n\n{_JSON_INSTRUCTION}"},
+        ]
+
+    async def _with_retries(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Run call with up to _MAX_ATTEMPTS tries and exponential backoff.
+
+        LLMRateLimitError is never retried — retrying against a quota wall is pointless.
+        """
+        attempt, delay = 1, 1.0
+        while True:
+            try:
+                return await call()
+            except LLMRateLimitError:
+                raise
+            except Exception as e:
+                if attempt >= _MAX_ATTEMPTS:
+                    raise
+                logger.warning(
+                    "llm_retry",
+                    attempt=attempt,
+                    wait_seconds=delay,
+                    error_type=type(e).__name__,
+                )
+                await asyncio.sleep(delay)
+                attempt, delay = attempt + 1, min(delay * 2, _MAX_BACKOFF)
+
     async def generate(self, system_prompt: str, user_prompt: str) -> str:
+        cache_key = self._cache_key(system_prompt, user_prompt, as_json=False)
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("llm_cache_hit", model=self._config.model)
+            return cached
+
+        result = await self._with_retries(lambda: self._generate_once(system_prompt, user_prompt))
+        await self._cache_put(cache_key, result)
+        return result
+
+    async def generate_json(self, system_prompt: str, user_prompt: str) -> dict:
+        cache_key = self._cache_key(system_prompt, user_prompt, as_json=True)
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("llm_cache_hit", model=self._config.model)
+            return orjson.loads(cached)
+
+        raw, parsed = await self._with_retries(
+            lambda: self._generate_json_once(system_prompt, user_prompt)
+        )
+        await self._cache_put(cache_key, raw)
+        return parsed
+
+    async def _generate_once(self, system_prompt: str, user_prompt: str) -> str:
+        await self._wait_for_cooldown()
         try:
             response = await self._client.chat.completions.create(
-                model=self._config.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt},
                 ],
-                temperature=self._config.temperature,
-                max_tokens=self._config.max_output_tokens,
+                **self._text_options,
             )
             result = response.choices[0].message.content or ""
             logger.debug("llm_generate", model=self._config.model, output_len=len(result))
@@ -96,27 +252,17 @@ class GroqClient(LLMClient):
             logger.error("llm_generate_error", model=self._config.model, error=str(e), error_type=type(e).__name__)
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(min=1, max=10),
-        retry=retry_if_not_exception_type(LLMRateLimitError),
-        before_sleep=before_sleep_log(_std_logger, logging.WARNING),
-    )
-    async def generate_json(self, system_prompt: str, user_prompt: str) -> dict:
+    async def _generate_json_once(self, system_prompt: str, user_prompt: str) -> tuple[str, dict]:
+        """Return the raw JSON text (for caching) alongside the parsed dict."""
+        await self._wait_for_cooldown()
         try:
             response = await self._client.chat.completions.create(
-                model=self._config.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt + "\n\nRespond ONLY with valid JSON, no markdown or extra text."},
-                ],
-                temperature=self._config.temperature,
-                max_tokens=self._config.max_output_tokens,
-                response_format={"type": "json_object"},
+                messages=self._json_messages(system_prompt, user_prompt),
+                **self._json_options,
             )
             raw = response.choices[0].message.content or "{}"
             logger.debug("llm_generate_json", model=self._config.model, output_len=len(raw))
-            return json.loads(raw)
+            return raw, orjson.loads(raw)
         except RateLimitError as e:
             logger.warning("llm_rate_limited", model=self._config.model, error=str(e))
             self._handle_rate_limit(e)
@@ -5,14 +5,18 @@ Rate limiting handled via httpx event hooks — transparent to all request metho
 """
 
 import asyncio
-from collections import deque
-from collections.abc import Callable
-from datetime import datetime, timedelta
-from typing import Any
+import random
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+from urllib.parse import urlencode, urlparse
 
 import httpx
-from pydantic import SecretStr
-from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
+import orjson
+from cachetools import TTLCache
+from pydantic import SecretStr, TypeAdapter
 
 from kyf.clients.base import AbstractMoltbookClient
 from kyf.logger import get_logger
@@ -34,6 +38,39 @@ from kyf.models.moltbook import (
 logger = get_logger(__name__)
 
 _MOLTBOOK_HOST = "www.moltbook.com"
+_HEARTBEAT_URL = f"https://{_MOLTBOOK_HOST}/heartbeat.md"
+
+# Retry policy for transient failures: full-jitter backoff, each sleep drawn
+# from [0, cap] where cap doubles 1s, 2s, ... up to 10s
+_MAX_ATTEMPTS = 3
+_MAX_BACKOFF = 10.0
+
+# Reads are safe to repeat; writes (posts, comments, votes) could land twice
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+# Statuses where the server promises it did not act on the request
+_WRITE_RETRY_STATUSES = frozenset({503, 504})
+
+# Max GET responses remembered for ETag revalidation
+_ETAG_CACHE_SIZE = 256
+
+# Max in-flight requests for the *_bulk helpers — keeps fan-out well
+# inside the connection pool and the server-side rate limit
+_BULK_CONCURRENCY = 16
+
+# Circuit breaker: consecutive server-side failures before failing fast,
+# and how long to stay open before letting a probe request through
+_BREAKER_THRESHOLD = 5
+_BREAKER_RESET_SECONDS = 30.0
+
+# Submolt metadata and our own profile change rarely but are read every cycle
+_LOOKUP_CACHE_TTL = 30.0
+
+# Built once — validates a whole list in a single call into pydantic-core
+_POSTS_ADAPTER = TypeAdapter(list[Post])
+_COMMENTS_ADAPTER = TypeAdapter(list[Comment])
+_SUBMOLTS_ADAPTER = TypeAdapter(list[Submolt])
+
+R = TypeVar("R")
 
 
 class MoltbookClientError(Exception):
@@ -44,41 +81,156 @@ class MoltbookClientError(Exception):
         super().__init__(message)
 
 
+class CircuitOpenError(MoltbookClientError):
+    """Raised without touching the network while the API is considered down."""
+
+
+def _is_retryable(method: str, exc: Exception) -> bool:
+    """Whether a failed request is worth repeating.
+
+    4xx never is. Reads retry on 5xx and transport errors; writes only when the
+    server refused outright (503/504) or the connection never opened.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        if method in _IDEMPOTENT_METHODS:
+            return status >= 500
+        return status in _WRITE_RETRY_STATUSES
+    if isinstance(exc, httpx.TransportError):
+        return method in _IDEMPOTENT_METHODS or isinstance(exc, httpx.ConnectError)
+    return False
+
+
+class _Cooldown:
+    """Shared deadline set when the server reports the quota is nearly spent.
+
+    Written by the response hook, honored by the request hook — so the next
+    call waits preemptively instead of burning a round-trip on a 429.
+    """
+
+    def __init__(self) -> None:
+        self.until = 0.0
+
+    def extend(self, seconds: float) -> None:
+        self.until = max(self.until, time.monotonic() + seconds)
+
+    async def wait(self) -> None:
+        remaining = self.until - time.monotonic()
+        if remaining > 0:
+            logger.debug("rate_limit_cooldown", seconds=round(remaining, 2))
+            await asyncio.sleep(remaining)
+
+
+def _is_server_failure(exc: Exception) -> bool:
+    """Transport errors and 5xx mean the API is unhealthy; a 4xx means it answered."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+class _CircuitBreaker:
+    """Fails fast during sustained outages instead of retrying into timeouts.
+
+    Closed: calls pass, consecutive server failures are counted. Open: after
+    `threshold` of them every call raises CircuitOpenError for `reset_timeout`
+    seconds. Half-open: the first call after that is let through as a probe
+    and restarts the timer, so concurrent callers keep failing fast — success
+    closes the breaker, failure keeps it open.
+    """
+
+    def __init__(self, threshold: int, reset_timeout: float) -> None:
+        self._threshold = threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    def before_call(self) -> None:
+        if self._opened_at is None:
+            return
+        now = time.monotonic()
+        if now - self._opened_at < self._reset_timeout:
+            raise CircuitOpenError(
+                "Moltbook API unavailable, skipping call",
+                hint=f"Circuit open after {self._failures} consecutive failures",
+            )
+        # A cancelled probe can't wedge the breaker — it just probes again later
+        self._opened_at = now
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info("circuit_closed")
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self._threshold:
+            self._opened_at = time.monotonic()
+            logger.warning(
+                "circuit_opened",
+                failures=self._failures,
+                reset_seconds=self._reset_timeout,
+            )
+
+
+def _reset_seconds(raw: str) -> float | None:
+    """Parse X-RateLimit-Reset, which may be seconds-until-reset or an epoch timestamp."""
+    try:
+        value = float(raw)
+    except ValueError:
+        return None
+    if value > 1_000_000_000:  # epoch seconds
+        value -= time.time()
+    return max(value, 0.0)
+
+
 def _build_rate_limit_hook(
-    max_requests: int = 90, window_seconds: int = 60
+    cooldown: _Cooldown, max_requests: int = 90, window_seconds: int = 60
 ) -> Callable[[httpx.Request], Any]:
     """Create an httpx request event hook that enforces rate limiting.
 
-    Uses a sliding window approach — tracks timestamps of recent requests
-    and sleeps if the limit is about to be exceeded.
+    A semaphore of ``max_requests`` permits, each handed back
+    ``window_seconds`` after it was taken — so at most ``max_requests``
+    requests start in any window. No lock: requests under the cap go
+    straight through in parallel.
     """
-    timestamps: deque[datetime] = deque()
-    lock = asyncio.Lock()
-    window = timedelta(seconds=window_seconds)
+    sem = asyncio.Semaphore(max_requests)
 
     async def hook(request: httpx.Request) -> None:
-        async with lock:
-            now = datetime.utcnow()
-            cutoff = now - window
+        await cooldown.wait()
+        if sem.locked():
+            logger.debug("rate_limit_wait", max_requests=max_requests, window_seconds=window_seconds)
+        await sem.acquire()
+        asyncio.get_running_loop().call_later(window_seconds, sem.release)
 
-            # Evict expired timestamps
-            while timestamps and timestamps[0] <= cutoff:
-                timestamps.popleft()
+    return hook
 
-            if len(timestamps) >= max_requests:
-                oldest = timestamps[0]
-                wait = (oldest + window - now).total_seconds()
-                if wait > 0:
-                    logger.debug("rate_limit_wait", seconds=round(wait, 2))
-                    await asyncio.sleep(wait)
 
-            timestamps.append(datetime.utcnow())
+# The 90/60s cap is per API key on the server side, so every client talking to
+# the same host must draw from one budget — keyed by netloc. The semaphore and
+# its call_later releases belong to one event loop, so each loop gets its own
+# set; weak keys drop a loop's limiters once the loop is gone.
+_HOST_LIMITERS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, tuple[_Cooldown, Callable[[httpx.Request], Any]]]
+] = weakref.WeakKeyDictionary()
 
-    return hook
 
+def _host_limiter(base_url: str) -> tuple[_Cooldown, Callable[[httpx.Request], Any]]:
+    """Return the cooldown and rate-limit hook shared by all clients of a host on this loop."""
+    limiters = _HOST_LIMITERS.setdefault(asyncio.get_running_loop(), {})
+    host = urlparse(base_url).netloc
+    limiter = limiters.get(host)
+    if limiter is None:
+        cooldown = _Cooldown()
+        limiter = limiters[host] = (cooldown, _build_rate_limit_hook(cooldown))
+    return limiter
 
-def _build_logging_hook() -> Callable[[httpx.Response], Any]:
-    """Create an httpx response event hook that logs all API responses."""
+
+def _build_logging_hook(cooldown: _Cooldown) -> Callable[[httpx.Response], Any]:
+    """Create an httpx response event hook that logs all API responses.
+
+    Also arms the shared cooldown when X-RateLimit-Remaining hits (almost) zero.
+    """
 
     async def hook(response: httpx.Response) -> None:
         # Log rate limit headers if present
@@ -90,6 +242,11 @@ def _build_logging_hook() -> Callable[[httpx.Response], Any]:
         if reset is not None:
             extra["rate_limit_reset"] = reset
 
+        if remaining is not None and reset is not None and remaining.isdigit() and int(remaining) <= 1:
+            reset_in = _reset_seconds(reset)
+            if reset_in:
+                cooldown.extend(reset_in)
+
         logger.debug(
             "api_response",
             method=response.request.method,
@@ -105,49 +262,147 @@ class MoltbookClient(AbstractMoltbookClient):
     """Concrete Moltbook API client with rate limiting via httpx hooks."""
 
     def __init__(self, base_url: str, api_key: SecretStr) -> None:
+        # The base URL is fixed for the client's lifetime, so the credential
+        # guard runs once here rather than on every request
+        if _MOLTBOOK_HOST not in base_url:
+            raise MoltbookClientError(
+                f"Refusing to send API key to untrusted host: {base_url}"
+            )
         self._base_url = base_url.rstrip("/")
-        self._api_key = api_key
+        # Precomputed once — reused every time the pooled client is (re)built
+        self._headers = {
+            "Authorization": f"Bearer {api_key.get_secret_value()}",
+            "Content-Type": "application/json",
+        }
         self._client: httpx.AsyncClient | None = None
+        self._heartbeat_client: httpx.AsyncClient | None = None
+        # path+query -> (etag, raw body); LRU-bounded to _ETAG_CACHE_SIZE
+        self._etag_cache: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._breaker = _CircuitBreaker(_BREAKER_THRESHOLD, _BREAKER_RESET_SECONDS)
+        self._submolt_cache: TTLCache[str, Submolt] = TTLCache(maxsize=128, ttl=_LOOKUP_CACHE_TTL)
+        self._profile_cache: TTLCache[str, AgentProfile] = TTLCache(maxsize=1, ttl=_LOOKUP_CACHE_TTL)
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None or self._client.is_closed:
+            cooldown, rate_limit_hook = _host_limiter(self._base_url)
             self._client = httpx.AsyncClient(
                 base_url=self._base_url,
-                headers={
-                    "Authorization": f"Bearer {self._api_key.get_secret_value()}",
-                    "Content-Type": "application/json",
-                },
+                headers=self._headers,
                 timeout=30.0,
+                # HTTP/2 multiplexes concurrent calls over one TLS connection
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=60.0,
+                ),
                 event_hooks={
-                    "request": [_build_rate_limit_hook()],
-                    "response": [_build_logging_hook()],
+                    "request": [rate_limit_hook],
+                    "response": [_build_logging_hook(cooldown)],
                 },
             )
         return self._client
 
-    def _validate_url(self, url: str) -> None:
-        """Ensure we only send credentials to moltbook.com."""
-        if _MOLTBOOK_HOST not in url and _MOLTBOOK_HOST not in self._base_url:
-            raise MoltbookClientError(
-                f"Refusing to send API key to untrusted host: {url}"
+    async def _get_heartbeat_client(self) -> httpx.AsyncClient:
+        """Long-lived unauthenticated client so heartbeats reuse a warm connection."""
+        if self._heartbeat_client is None or self._heartbeat_client.is_closed:
+            self._heartbeat_client = httpx.AsyncClient(
+                timeout=15.0,
+                limits=httpx.Limits(max_keepalive_connections=1, keepalive_expiry=300),
             )
+        return self._heartbeat_client
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(min=1, max=10),
-        retry=retry_if_not_exception_type(MoltbookClientError),
-    )
     async def _request(
-        self, method: str, path: str, json_data: dict[str, Any] | None = None
+        self,
+        method: str,
+        path: str,
+        json_bytes: bytes | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send a request, retrying transient failures with full-jitter backoff.
+
+        Randomized sleeps keep concurrent tasks (or several bots) that failed
+        together from retrying in lockstep. Only failures _is_retryable accepts
+        are repeated, so a comment or vote is never posted twice. MoltbookClientError
+        means the API answered with an error — never retried. While the circuit
+        breaker is open, CircuitOpenError is raised without a network call.
+        """
+        attempt, cap = 1, 1.0
+        while True:
+            self._breaker.before_call()
+            try:
+                data = await self._request_once(method, path, json_bytes, params)
+            except MoltbookClientError:
+                self._breaker.record_success()  # the API answered
+                raise
+            except Exception as e:
+                if _is_server_failure(e):
+                    self._breaker.record_failure()
+                else:
+                    self._breaker.record_success()
+                if attempt >= _MAX_ATTEMPTS or not _is_retryable(method, e):
+                    raise
+                delay = random.uniform(0, cap)
+                logger.debug(
+                    "api_retry",
+                    method=method,
+                    path=path,
+                    attempt=attempt,
+                    wait_seconds=round(delay, 2),
+                    error_type=type(e).__name__,
+                )
+                await asyncio.sleep(delay)
+                attempt, cap = attempt + 1, min(cap * 2, _MAX_BACKOFF)
+            else:
+                self._breaker.record_success()
+                return data
+
+    async def _request_once(
+        self,
+        method: str,
+        path: str,
+        json_bytes: bytes | None = None,
+        params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         client = await self._get_client()
-        full_url = f"{self._base_url}{path}"
-        self._validate_url(full_url)
 
-        response = await client.request(method, path, json=json_data)
+        etag_key: str | None = None
+        # Held locally: a concurrent GET may evict the entry before our 304 arrives
+        cached: tuple[str, bytes] | None = None
+        headers: dict[str, str] | None = None
+        if method == "GET":
+            etag_key = f"{path}?{urlencode(sorted(params.items()))}" if params else path
+            cached = self._etag_cache.get(etag_key)
+            if cached is not None:
+                headers = {"If-None-Match": cached[0]}
+
+        # Bodies arrive pre-serialized (model_dump_json) — the client already
+        # sends Content-Type: application/json, so httpx doesn't re-encode
+        response = await client.request(
+            method, path, content=json_bytes, params=params, headers=headers
+        )
+
+        if etag_key is not None and response.status_code == 304 and cached is None:
+            # A 304 we have no body for — forget any stored ETag and re-ask
+            # unconditionally rather than fail the call on a 3xx
+            self._etag_cache.pop(etag_key, None)
+            logger.debug("etag_304_without_cache", path=path)
+            response = await client.request(method, path, params=params)
+
+        if etag_key is not None:
+            if response.status_code == 304 and cached is not None:
+                # Unchanged since last poll — reuse the stored body, no transfer
+                if etag_key in self._etag_cache:
+                    self._etag_cache.move_to_end(etag_key)
+                return orjson.loads(cached[1])
+            if response.is_success and (etag := response.headers.get("etag")):
+                self._etag_cache[etag_key] = (etag, response.content)
+                self._etag_cache.move_to_end(etag_key)
+                if len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
 
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
         except Exception:
             response.raise_for_status()
             return {}
@@ -168,31 +423,71 @@ class MoltbookClient(AbstractMoltbookClient):
         response.raise_for_status()
         return data
 
+    async def _gather_bounded(
+        self, fn: Callable[[str], Awaitable[R]], post_ids: list[str], failure_event: str
+    ) -> dict[str, R]:
+        """Run fn per post ID, at most _BULK_CONCURRENCY at a time; results keyed by ID.
+
+        A failed call is logged as `failure_event` and left out, so one bad
+        post doesn't sink the batch.
+        """
+        sem = asyncio.Semaphore(_BULK_CONCURRENCY)
+
+        async def one(post_id: str) -> R:
+            async with sem:
+                return await fn(post_id)
+
+        results = await asyncio.gather(*(one(pid) for pid in post_ids), return_exceptions=True)
+        found: dict[str, R] = {}
+        for post_id, result in zip(post_ids, results):
+            if isinstance(result, Exception):
+                logger.warning(failure_event, post_id=post_id, error=str(result))
+            elif isinstance(result, BaseException):
+                raise result  # cancellation — not a per-post failure
+            else:
+                found[post_id] = result
+        return found
+
     # --- Posts ---
 
     async def get_posts(
         self, sort: PostSortOrder = PostSortOrder.HOT, submolt: str | None = None
     ) -> list[Post]:
-        params = f"?sort={sort.value}"
-        if submolt:
-            params += f"&submolt={submolt}"
-        data = await self._request("GET", f"/posts{params}")
-        return [Post.model_validate(p) for p in data.get("posts", data.get("data", []))]
+        return _POSTS_ADAPTER.validate_python(await self.get_posts_raw(sort, submolt))
+
+    async def get_posts_raw(
+        self, sort: PostSortOrder = PostSortOrder.HOT, submolt: str | None = None
+    ) -> list[dict[str, Any]]:
+        # httpx handles URL-encoding; None values are dropped up front
+        params = {"sort": sort.value, "submolt": submolt}
+        data = await self._request(
+            "GET", "/posts", params={k: v for k, v in params.items() if v is not None}
+        )
+        return data.get("posts", data.get("data", []))
 
     async def get_feed(
         self, sort: PostSortOrder = PostSortOrder.HOT, limit: int = 25
     ) -> list[Post]:
         """Get personalized feed (from subscribed submolts and followed agents)."""
-        data = await self._request("GET", f"/feed?sort={sort.value}&limit={limit}")
-        return [Post.model_validate(p) for p in data.get("posts", data.get("data", []))]
+        return _POSTS_ADAPTER.validate_python(await self.get_feed_raw(sort, limit))
+
+    async def get_feed_raw(
+        self, sort: PostSortOrder = PostSortOrder.HOT, limit: int = 25
+    ) -> list[dict[str, Any]]:
+        data = await self._request("GET", "/feed", params={"sort": sort.value, "limit": limit})
+        return data.get("posts", data.get("data", []))
 
     async def get_post(self, post_id: str) -> Post:
         data = await self._request("GET", f"/posts/{post_id}")
         post_data = data.get("post", data.get("data", {}))
         return Post.model_validate(post_data)
 
+    async def get_posts_bulk(self, post_ids: list[str]) -> dict[str, Post]:
+        """Fetch several posts concurrently; posts that fail to load are logged and omitted."""
+        return await self._gather_bounded(self.get_post, post_ids, "post_fetch_failed")
+
     async def create_post(self, request: CreatePostRequest) -> Post:
-        data = await self._request("POST", "/posts", json_data=request.model_dump(exclude_none=True))
+        data = await self._request("POST", "/posts", json_bytes=request.model_dump_json(exclude_none=True).encode())
         post_data = data.get("post", data.get("data", {}))
         logger.info("post_created", submolt=request.submolt, title=request.title[:50])
         return Post.model_validate(post_data)
@@ -205,15 +500,23 @@ class MoltbookClient(AbstractMoltbookClient):
     async def get_comments(
         self, post_id: str, sort: CommentSortOrder = CommentSortOrder.TOP
     ) -> list[Comment]:
-        data = await self._request("GET", f"/posts/{post_id}/comments?sort={sort.value}")
-        return [Comment.model_validate(c) for c in data.get("comments", data.get("data", []))]
+        data = await self._request("GET", f"/posts/{post_id}/comments", params={"sort": sort.value})
+        return _COMMENTS_ADAPTER.validate_python(data.get("comments", data.get("data", [])))
+
+    async def get_comments_bulk(
+        self, post_ids: list[str], sort: CommentSortOrder = CommentSortOrder.TOP
+    ) -> dict[str, list[Comment]]:
+        """Fetch comments for several posts concurrently; failed posts are logged and omitted."""
+        return await self._gather_bounded(
+            lambda pid: self.get_comments(pid, sort=sort), post_ids, "comments_fetch_failed"
+        )
 
     async def create_comment(self, request: CreateCommentRequest) -> Comment:
         # API expects POST /posts/:id/comments with {content, parent_id} in body
         data = await self._request(
             "POST",
             f"/posts/{request.post_id}/comments",
-            json_data=request.model_dump(exclude_none=True),
+            json_bytes=request.model_dump_json(exclude_none=True).encode(),
         )
         comment_data = data.get("comment", data.get("data", {}))
         logger.info("comment_created", post_id=request.post_id)
@@ -233,47 +536,65 @@ class MoltbookClient(AbstractMoltbookClient):
 
     async def get_submolts(self) -> list[Submolt]:
         data = await self._request("GET", "/submolts")
-        return [Submolt.model_validate(s) for s in data.get("submolts", data.get("data", []))]
+        return _SUBMOLTS_ADAPTER.validate_python(data.get("submolts", data.get("data", [])))
 
     async def get_submolt(self, name: str) -> Submolt:
+        cached = self._submolt_cache.get(name)
+        if cached is not None:
+            return cached
         data = await self._request("GET", f"/submolts/{name}")
         submolt_data = data.get("submolt", data.get("data", {}))
-        return Submolt.model_validate(submolt_data)
+        submolt = Submolt.model_validate(submolt_data)
+        self._submolt_cache[name] = submolt
+        return submolt
 
     async def create_submolt(self, request: CreateSubmoltRequest) -> Submolt:
-        data = await self._request("POST", "/submolts", json_data=request.model_dump(exclude_none=True))
+        data = await self._request("POST", "/submolts", json_bytes=request.model_dump_json(exclude_none=True).encode())
         submolt_data = data.get("submolt", data.get("data", {}))
         logger.info("submolt_created", name=request.name)
+        self._submolt_cache.pop(request.name, None)
         return Submolt.model_validate(submolt_data)
 
     async def subscribe(self, submolt_name: str) -> None:
         await self._request("POST", f"/submolts/{submolt_name}/subscribe")
+        self._submolt_cache.pop(submolt_name, None)
 
     async def unsubscribe(self, submolt_name: str) -> None:
         await self._request("DELETE", f"/submolts/{submolt_name}/subscribe")
+        self._submolt_cache.pop(submolt_name, None)
 
     # --- Profile ---
 
     async def get_profile(self) -> AgentProfile:
+        cached = self._profile_cache.get("me")
+        if cached is not None:
+            return cached
         data = await self._request("GET", "/agents/me")
         profile_data = data.get("agent", data.get("data", {}))
-        return AgentProfile.model_validate(profile_data)
+        profile = AgentProfile.model_validate(profile_data)
+        self._profile_cache["me"] = profile
+        return profile
 
     async def update_profile(self, request: UpdateProfileRequest) -> AgentProfile:
-        data = await self._request("PATCH", "/agents/me", json_data=request.model_dump(exclude_none=True))
+        data = await self._request("PATCH", "/agents/me", json_bytes=request.model_dump_json(exclude_none=True).encode())
         profile_data = data.get("agent", data.get("data", {}))
-        return AgentProfile.model_validate(profile_data)
+        profile = AgentProfile.model_validate(profile_data)
+        self._profile_cache["me"] = profile
+        return profile
 
     # --- Heartbeat ---
 
     async def fetch_heartbeat(self) -> str:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get("https://www.moltbook.com/heartbeat.md")
-            resp.raise_for_status()
-            return resp.text
+        # Static public URL, no credentials sent — no host guard needed
+        client = await self._get_heartbeat_client()
+        resp = await client.get(_HEARTBEAT_URL)
+        resp.raise_for_status()
+        return resp.text
 
     # --- Lifecycle ---
 
     async def close(self) -> None:
         if self._client and not self._client.is_closed:
             await self._client.aclose()
+        if self._heartbeat_client and not self._heartbeat_client.is_closed:
+            await self._heartbeat_client.aclose()
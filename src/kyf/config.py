@@ -1,5 +1,7 @@
 """Application configuration loaded from environment variables with Pydantic validation."""
 
+from functools import lru_cache
+
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -18,6 +20,8 @@ class Settings(BaseSettings):
     # Groq
     groq_api_key: SecretStr
     groq_model: str = "llama-3.3-70b-versatile"
+    # Responses are only cached at 0 — sampled replies are meant to vary
+    groq_temperature: float = Field(default=0.8, ge=0.0, le=2.0)
 
     # Agent behavior
     heartbeat_interval_hours: int = Field(default=4, ge=1, le=24)
@@ -32,6 +36,11 @@ class Settings(BaseSettings):
     db_path: str = "data/kyf_state.db"
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
-    """Load and validate settings from environment."""
+    """Load and validate settings from environment.
+
+    Cached: .env is read once per process. Call load_settings.cache_clear()
+    to pick up changed environment variables.
+    """
     return Settings()
@@ -5,9 +5,12 @@ Dependency Inversion: depends on abstractions, not concrete implementations.
 Single Responsibility: only orchestrates the flow, delegates to services.
 """
 
-import json
+import asyncio
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
+
+import orjson
 
 from kyf.clients.base import AbstractMoltbookClient
 from kyf.clients.llm_client import LLMClient, LLMRateLimitError
@@ -20,7 +23,7 @@ from kyf.core.interfaces import (
 )
 from kyf.logger import get_logger
 from kyf.models.agent_state import ActionLog, ActionType
-from kyf.models.llm import CommentReplyResponse
+from kyf.models.llm import AnalysisResult, CommentReplyResponse
 from kyf.models.moltbook import (
     Comment,
     CommentVoteRequest,
@@ -36,6 +39,24 @@ from kyf.utils.sanitizer import InputSanitizer
 
 logger = get_logger(__name__)
 
+# Fact-checks generated and posted at once — bounded so a large batch doesn't
+# burst the LLM quota; Moltbook pacing is still enforced by the client hook
+_ENGAGE_CONCURRENCY = 3
+# Checkable posts selected beyond the comment budget, as fallbacks for
+# posts whose fact-check or comment fails
+_ENGAGE_SPARES = 3
+
+# Comments shorter than this ("nice!", "+1") aren't worth an LLM reply
+_MIN_REPLY_BODY = 20
+
+# Fact-check verdict -> vote on the post; other verdicts (e.g. unverifiable) don't vote
+_VERDICT_VOTES = {
+    "true": VoteDirection.UPVOTE,
+    "mostly_true": VoteDirection.UPVOTE,
+    "false": VoteDirection.DOWNVOTE,
+    "misleading": VoteDirection.DOWNVOTE,
+}
+
 
 class KYFAgent:
     """Main agent that runs the heartbeat loop.
@@ -68,10 +89,13 @@ class KYFAgent:
         self._data_dir = Path(data_dir)
         self._llm_limited = False
         self._agent_username: str | None = None
+        self._username_lock = asyncio.Lock()
+        # Actions buffered during a heartbeat, written in one batch at its end
+        self._pending_actions: list[ActionLog] = []
 
     def _write_llm_limits(self, error: LLMRateLimitError, phase: str) -> None:
-        """Write rate limit details to llm-limits.json for later inspection."""
-        limits_path = self._data_dir / "llm-limits.json"
+        """Append rate limit details to llm-limits.jsonl for later inspection."""
+        limits_path = self._data_dir / "llm-limits.jsonl"
         entry = {
             "hit_at": datetime.now(timezone.utc).isoformat(),
             "phase": phase,
@@ -79,16 +103,9 @@ class KYFAgent:
             "retry_after_seconds": error.retry_after,
         }
 
-        # Append to existing entries if file exists
-        entries: list[dict] = []
-        if limits_path.exists():
-            try:
-                entries = json.loads(limits_path.read_text())
-            except (json.JSONDecodeError, OSError):
-                entries = []
-
-        entries.append(entry)
-        limits_path.write_text(json.dumps(entries, indent=2))
+        # Append-only JSONL — O(1) per hit, no re-parse of earlier entries
+        with limits_path.open("ab") as f:
+            f.write(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE))
         logger.warning(
             "llm_limit_logged",
             path=str(limits_path),
@@ -102,11 +119,13 @@ class KYFAgent:
 
         try:
             await self._fetch_heartbeat()
-            await self._browse_and_engage()
-            await self._reply_to_comments_on_own_posts()
-            await self._maybe_create_post()
+            # Seen/replied marks stay in memory and are written once, on exit
+            async with self._state_repo.transaction():
+                await self._browse_and_engage()
+                await self._reply_to_comments_on_own_posts()
+                await self._maybe_create_post()
 
-            await self._state_repo.log_action(
+            self._pending_actions.append(
                 ActionLog(action_type=ActionType.HEARTBEAT)
             )
             logger.info("heartbeat_complete")
@@ -117,7 +136,32 @@ class KYFAgent:
             logger.error("heartbeat_aborted_llm_limit", error=str(e))
 
         except Exception as e:
-            logger.error("heartbeat_failed", error=str(e), error_type=type(e).__name__)
+            logger.error("heartbeat_failed", exc_info=True)
+
+        finally:
+            await self._flush_actions()
+
+    async def _flush_actions(self) -> None:
+        """Persist buffered actions with one repository write.
+
+        If the bulk write fails, actions are retried one by one; any that
+        still fail go back in the buffer for the next heartbeat's flush.
+        """
+        if not self._pending_actions:
+            return
+        actions, self._pending_actions = self._pending_actions, []
+        try:
+            await self._state_repo.log_actions_bulk(actions)
+            return
+        except Exception as e:
+            logger.error("action_flush_failed", count=len(actions), error=str(e))
+
+        for action in actions:
+            try:
+                await self._state_repo.log_action(action)
+            except Exception as e:
+                logger.error("action_log_failed", action_type=action.action_type.value, error=str(e))
+                self._pending_actions.append(action)
 
     async def _fetch_heartbeat(self) -> None:
         try:
@@ -126,35 +170,55 @@ class KYFAgent:
         except Exception as e:
             logger.warning("heartbeat_fetch_failed", error=str(e))
 
+    async def _fetch_feed(self, sort_order: PostSortOrder) -> list[dict[str, Any]]:
+        """Try personalized feed first, fall back to global posts.
+
+        Returns raw post dicts — validation into Post is deferred until
+        already-seen posts have been dropped.
+        """
+        try:
+            posts = await self._moltbook.get_feed_raw(sort=sort_order)
+            logger.info("feed_fetched", source="personalized", sort=sort_order.value, post_count=len(posts))
+        except Exception:
+            posts = await self._moltbook.get_posts_raw(sort=sort_order)
+            logger.info("feed_fetched", source="global", sort=sort_order.value, post_count=len(posts))
+        return posts
+
     async def _browse_and_engage(self) -> None:
         """Browse feed, analyze posts, and respond to fact-checkable claims."""
         comments_made = 0
 
-        for sort_order in [PostSortOrder.HOT, PostSortOrder.NEW]:
+        # Both feeds are independent GETs — fetch them concurrently, then
+        # process in order so HOT still gets first claim on the comment budget
+        sort_orders = [PostSortOrder.HOT, PostSortOrder.NEW]
+        feeds = await asyncio.gather(
+            *(self._fetch_feed(sort_order) for sort_order in sort_orders),
+            return_exceptions=True,
+        )
+
+        for sort_order, posts in zip(sort_orders, feeds):
             if comments_made >= self._max_comments_per_heartbeat:
                 break
 
-            try:
-                # Try personalized feed first, fall back to global posts
-                try:
-                    posts = await self._moltbook.get_feed(sort=sort_order)
-                    logger.info("feed_fetched", source="personalized", sort=sort_order.value, post_count=len(posts))
-                except Exception:
-                    posts = await self._moltbook.get_posts(sort=sort_order)
-                    logger.info("feed_fetched", source="global", sort=sort_order.value, post_count=len(posts))
-            except MoltbookClientError as e:
-                logger.error("feed_fetch_failed", sort=sort_order.value, error=str(e))
+            if isinstance(posts, MoltbookClientError):
+                logger.error("feed_fetch_failed", sort=sort_order.value, error=str(posts))
                 continue
+            if isinstance(posts, BaseException):
+                raise posts
 
             if not posts:
                 logger.info("feed_empty", sort=sort_order.value)
                 continue
 
+            # One lookup and one write per feed instead of two awaits per post;
+            # only unseen posts are validated into Post models
+            unseen_ids = set(await self._state_repo.filter_unseen([p.get("id") for p in posts]))
             unseen = []
-            for post in posts:
-                if not await self._state_repo.is_post_seen(post.id):
-                    unseen.append(post)
-                    await self._state_repo.mark_post_seen(post.id)
+            for raw in posts:
+                if raw.get("id") in unseen_ids:
+                    unseen.append(Post.model_validate(raw))
+                    unseen_ids.discard(raw["id"])
+            await self._state_repo.mark_seen_bulk([p.id for p in unseen])
 
             logger.info(
                 "feed_filtered",
@@ -176,62 +240,97 @@ class KYFAgent:
                     submolt=p.submolt or "none",
                 )
 
-            # LLMRateLimitError bubbles up to run_heartbeat — stops the whole cycle
-            checkable = await self._analyzer.filter_checkable(unseen)
+            # LLMRateLimitError bubbles up to run_heartbeat — stops the whole cycle.
+            # A few spares past the budget let a failed post fall through to the next
+            budget = self._max_comments_per_heartbeat - comments_made
+            checkable = await self._analyzer.filter_checkable(
+                unseen, limit=budget + _ENGAGE_SPARES
+            )
             logger.info("analysis_complete", unseen=len(unseen), checkable=len(checkable))
 
-            for post, analysis in checkable:
-                if comments_made >= self._max_comments_per_heartbeat:
-                    break
+            # Workers pull the next candidate until the budget is met. Posts in
+            # flight count against it, so concurrent workers can't overshoot;
+            # one that fails frees its slot for the next candidate
+            candidates = iter(checkable)
+            posted = in_flight = 0
+            rate_limited = False
+
+            async def engage_worker() -> None:
+                nonlocal posted, in_flight, rate_limited
+                # Once the LLM quota is hit, no new post starts
+                while not rate_limited and posted + in_flight < budget:
+                    item = next(candidates, None)
+                    if item is None:
+                        return
+                    in_flight += 1
+                    try:
+                        if await self._engage_post(*item):
+                            posted += 1
+                    except LLMRateLimitError:
+                        rate_limited = True
+                        raise
+                    finally:
+                        in_flight -= 1
+
+            # return_exceptions lets in-flight comments finish before an
+            # LLMRateLimitError is re-raised, instead of orphaning them
+            results = await asyncio.gather(
+                *(engage_worker() for _ in range(min(_ENGAGE_CONCURRENCY, len(checkable)))),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            comments_made += posted
 
-                try:
-                    logger.info(
-                        "fact_checking_post",
-                        post_id=post.id,
-                        title=post.title[:60],
-                        confidence=analysis.confidence,
-                        claim=analysis.claim_summary or "none",
-                    )
-                    response = await self._fact_checker.generate_reply(post, analysis)
+        logger.info("browse_complete", comments_made=comments_made)
 
-                    await self._moltbook.create_comment(
-                        CreateCommentRequest(
-                            post_id=post.id,
-                            content=response.response_text,
-                        )
-                    )
+    async def _engage_post(self, post: Post, analysis: AnalysisResult) -> bool:
+        """Fact-check one post and comment on it. Returns whether a comment was posted."""
+        try:
+            logger.info(
+                "fact_checking_post",
+                post_id=post.id,
+                title=post.title[:60],
+                confidence=analysis.confidence,
+                claim=analysis.claim_summary or "none",
+            )
+            response = await self._fact_checker.generate_reply(post, analysis)
 
-                    await self._state_repo.log_action(
-                        ActionLog(
-                            action_type=ActionType.COMMENT_CREATED,
-                            target_id=post.id,
-                            details=f"verdict={response.verdict}",
-                        )
-                    )
+            await self._moltbook.create_comment(
+                CreateCommentRequest(
+                    post_id=post.id,
+                    content=response.response_text,
+                )
+            )
 
-                    comments_made += 1
-                    logger.info("comment_posted", post_id=post.id, verdict=response.verdict)
-                    await self._vote_on_post(post.id, response.verdict)
+            self._pending_actions.append(
+                ActionLog(
+                    action_type=ActionType.COMMENT_CREATED,
+                    target_id=post.id,
+                    details=f"verdict={response.verdict}",
+                )
+            )
 
-                except LLMRateLimitError:
-                    raise  # let it bubble up
+            logger.info("comment_posted", post_id=post.id, verdict=response.verdict)
+            await self._vote_on_post(post.id, response.verdict)
+            return True
 
-                except Exception as e:
-                    logger.error("engage_failed", post_id=post.id, error=str(e), error_type=type(e).__name__)
+        except LLMRateLimitError:
+            raise  # let it bubble up
 
-        logger.info("browse_complete", comments_made=comments_made)
+        except Exception:
+            logger.error("engage_failed", post_id=post.id, exc_info=True)
+            return False
 
     async def _vote_on_post(self, post_id: str, verdict: str) -> None:
         try:
-            if verdict in ("true", "mostly_true"):
-                direction = VoteDirection.UPVOTE
-            elif verdict in ("false", "misleading"):
-                direction = VoteDirection.DOWNVOTE
-            else:
+            direction = _VERDICT_VOTES.get(verdict)
+            if direction is None:
                 return
 
             await self._moltbook.vote(VoteRequest(target_id=post_id, direction=direction))
-            await self._state_repo.log_action(
+            self._pending_actions.append(
                 ActionLog(
                     action_type=ActionType.VOTE_CAST,
                     target_id=post_id,
@@ -242,57 +341,74 @@ class KYFAgent:
             logger.warning("vote_failed", post_id=post_id, error=str(e))
 
     async def _get_agent_username(self) -> str | None:
-        """Get and cache the agent's username to avoid replying to self."""
-        if self._agent_username is None:
-            try:
-                profile = await self._moltbook.get_profile()
-                self._agent_username = profile.username or profile.name
-            except Exception as e:
-                logger.warning("profile_fetch_failed", error=str(e))
+        """Get and cache the agent's username to avoid replying to self.
+
+        The lock makes concurrent callers share one profile fetch; a failed
+        fetch isn't cached, so a later call tries again.
+        """
+        if self._agent_username is not None:
+            return self._agent_username
+        async with self._username_lock:
+            if self._agent_username is None:
+                try:
+                    profile = await self._moltbook.get_profile()
+                    self._agent_username = profile.username or profile.name
+                except Exception as e:
+                    logger.warning("profile_fetch_failed", error=str(e))
         return self._agent_username
 
     async def _reply_to_comments_on_own_posts(self) -> None:
         """Fetch comments on agent's own posts and reply to new ones."""
         replies_made = 0
 
-        own_post_ids = await self._state_repo.get_action_target_ids(ActionType.POST_CREATED)
-        if not own_post_ids:
+        # Most recent posts first, limited to the last 10
+        post_ids = await self._state_repo.get_recent_action_target_ids(ActionType.POST_CREATED, limit=10)
+        if not post_ids:
             logger.info("own_post_replies_complete", replies_made=0, reason="no_own_posts")
             return
 
         agent_username = await self._get_agent_username()
 
-        # Process most recent posts first, limit to last 10
-        for post_id in reversed(own_post_ids[-10:]):
+        # The post itself (context for the reply prompt) comes from the snapshot
+        # saved at creation when available, so usually only comments need a round-trip
+        snapshots = {pid: await self._state_repo.get_post_snapshot(pid) for pid in post_ids}
+        missing = [pid for pid, snapshot in snapshots.items() if snapshot is None]
+
+        # All threads are fetched up front, concurrently, then replied to in order
+        comments_by_post, fetched_posts = await asyncio.gather(
+            self._moltbook.get_comments_bulk(post_ids),
+            self._moltbook.get_posts_bulk(missing),
+        )
+
+        for post_id in post_ids:
             if replies_made >= self._max_replies_per_heartbeat:
                 break
 
-            try:
-                comments = await self._moltbook.get_comments(post_id)
-            except Exception as e:
-                logger.warning("comments_fetch_failed", post_id=post_id, error=str(e))
+            comments = comments_by_post.get(post_id)
+            post = snapshots[post_id] or fetched_posts.get(post_id)
+            if not comments or post is None:
                 continue
 
-            if not comments:
+            # Cheap local filters first: skip own comments (don't reply to
+            # self) and one-liners too short to say anything worth answering
+            candidates = [
+                c
+                for c in comments
+                if not (agent_username and c.author_name == agent_username)
+                and len(c.body.strip()) >= _MIN_REPLY_BODY
+            ]
+            if not candidates:
                 continue
 
-            # Get the original post for context in the reply prompt
-            try:
-                post = await self._moltbook.get_post(post_id)
-            except Exception as e:
-                logger.warning("post_fetch_failed", post_id=post_id, error=str(e))
-                continue
+            # Then one replied-lookup per thread instead of one await per comment
+            replied = await self._state_repo.get_replied_comment_ids([c.id for c in candidates])
 
-            for comment in comments:
+            for comment in candidates:
                 if replies_made >= self._max_replies_per_heartbeat:
                     break
 
                 # Skip already-replied comments
-                if await self._state_repo.is_comment_replied(comment.id):
-                    continue
-
-                # Skip own comments (don't reply to self)
-                if agent_username and comment.author_name == agent_username:
+                if comment.id in replied:
                     continue
 
                 try:
@@ -307,7 +423,7 @@ class KYFAgent:
                     )
 
                     await self._state_repo.mark_comment_replied(comment.id)
-                    await self._state_repo.log_action(
+                    self._pending_actions.append(
                         ActionLog(
                             action_type=ActionType.COMMENT_REPLIED,
                             target_id=comment.id,
@@ -327,13 +443,8 @@ class KYFAgent:
 
                 except LLMRateLimitError:
                     raise
-                except Exception as e:
-                    logger.error(
-                        "comment_reply_failed",
-                        comment_id=comment.id,
-                        error=str(e),
-                        error_type=type(e).__name__,
-                    )
+                except Exception:
+                    logger.error("comment_reply_failed", comment_id=comment.id, exc_info=True)
 
         logger.info("own_post_replies_complete", replies_made=replies_made)
 
@@ -363,7 +474,7 @@ class KYFAgent:
             await self._moltbook.vote_comment(
                 CommentVoteRequest(comment_id=comment.id, direction=VoteDirection.UPVOTE)
             )
-            await self._state_repo.log_action(
+            self._pending_actions.append(
                 ActionLog(
                     action_type=ActionType.COMMENT_VOTE_CAST,
                     target_id=comment.id,
@@ -402,6 +513,8 @@ class KYFAgent:
                 )
             )
 
+            # Logged right away, not buffered: the daily post budget is read
+            # from this count, and a lost flush must not let it be exceeded
             await self._state_repo.log_action(
                 ActionLog(
                     action_type=ActionType.POST_CREATED,
@@ -409,15 +522,20 @@ class KYFAgent:
                     details=content.topic_category,
                 )
             )
+            # The API may echo back a partial post — snapshot what we sent
+            await self._state_repo.save_post_snapshot(
+                Post(id=post.id, title=content.title, body=content.body)
+            )
             logger.info("original_post_published", post_id=post.id, title=content.title[:50])
 
         except LLMRateLimitError:
             raise  # let it bubble up
 
-        except Exception as e:
-            logger.error("post_creation_failed", error=str(e), error_type=type(e).__name__)
+        except Exception:
+            logger.error("post_creation_failed", exc_info=True)
 
     async def shutdown(self) -> None:
         await self._moltbook.close()
+        await self._llm.close()
         await self._state_repo.close()
         logger.info("agent_shutdown")
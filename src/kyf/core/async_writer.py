@@ -0,0 +1,101 @@
+"""Background-thread file appender for non-critical state writes.
+
+Appends are queued from the event loop and written by a daemon thread, so
+disk I/O never stalls the heartbeat. Whatever has queued up while the thread
+was busy is written with one open per file.
+"""
+
+import asyncio
+import queue
+import threading
+from pathlib import Path
+
+from kyf.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncArtifactWriter:
+    """Appends text to files from a single daemon thread, in enqueue order."""
+
+    def __init__(self) -> None:
+        # None is the stop sentinel
+        self._queue: queue.Queue[tuple[Path, str] | None] = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="kyf-artifact-writer", daemon=True)
+        self._thread.start()
+
+    def append(self, path: Path, text: str) -> None:
+        """Queue `text` to be appended to `path`. Never blocks while the writer is open.
+
+        After close() there is no thread left to drain the queue, so the
+        append is written synchronously instead of being dropped.
+        """
+        if self._closed:
+            self._write(path, [text])
+            return
+        self._queue.put((path, text))
+
+    async def flush(self) -> None:
+        """Wait until everything queued so far is on disk."""
+        if self._closed:
+            return
+        await asyncio.to_thread(self._queue.join)
+
+    async def close(self) -> None:
+        """Flush pending writes and stop the thread."""
+        if self._closed:
+            return
+        self._queue.put(None)
+        await asyncio.to_thread(self._thread.join)
+        self._closed = True
+        # Appends made while the thread was stopping landed behind the sentinel
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self._write(item[0], [item[1]])
+
+    @staticmethod
+    def _write(path: Path, chunks: list[str]) -> None:
+        # Failures are logged, never raised — a dead writer thread would hang flush()
+        try:
+            with path.open("a", encoding="utf-8") as f:
+                for chunk in chunks:
+                    try:
+                        f.write(chunk)
+                    except Exception as e:
+                        # e.g. unencodable text — lose this item, keep the rest
+                        logger.error("artifact_write_failed", path=str(path), error=str(e))
+        except Exception as e:
+            logger.error("artifact_write_failed", path=str(path), error=str(e))
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            stop = False
+            try:
+                # Drain what's already waiting so a burst costs one write per file
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                pending: dict[Path, list[str]] = {}
+                for item in batch:
+                    if item is None:
+                        stop = True
+                        continue
+                    pending.setdefault(item[0], []).append(item[1])
+
+                for path, chunks in pending.items():
+                    self._write(path, chunks)
+            finally:
+                # Always balance get() — flush() joins on the queue
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
@@ -5,6 +5,7 @@ Concrete implementations can be swapped without touching the agent.
 """
 
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
 
 from kyf.models.agent_state import ActionLog, ActionType, AgentState
 from kyf.models.llm import AnalysisResult, FactCheckResponse, OriginalPostContent
@@ -29,9 +30,24 @@ class AbstractStateRepository(ABC):
     @abstractmethod
     async def is_post_seen(self, post_id: str) -> bool: ...
 
+    @abstractmethod
+    async def filter_unseen(self, post_ids: list[str]) -> list[str]:
+        """Return the IDs not yet seen, de-duplicated, in input order."""
+        ...
+
+    @abstractmethod
+    async def mark_seen_bulk(self, post_ids: list[str]) -> None:
+        """Mark many posts seen in one write."""
+        ...
+
     @abstractmethod
     async def log_action(self, action: ActionLog) -> None: ...
 
+    @abstractmethod
+    async def log_actions_bulk(self, actions: list[ActionLog]) -> None:
+        """Append many actions in one write."""
+        ...
+
     @abstractmethod
     async def get_today_action_count(self, action_type: ActionType) -> int: ...
 
@@ -41,9 +57,34 @@ class AbstractStateRepository(ABC):
     @abstractmethod
     async def is_comment_replied(self, comment_id: str) -> bool: ...
 
+    @abstractmethod
+    async def get_replied_comment_ids(self, comment_ids: list[str]) -> set[str]:
+        """Return the subset of comment_ids already replied to."""
+        ...
+
     @abstractmethod
     async def get_action_target_ids(self, action_type: ActionType) -> list[str]: ...
 
+    @abstractmethod
+    async def get_recent_action_target_ids(
+        self, action_type: ActionType, limit: int
+    ) -> list[str]:
+        """Return up to `limit` target_ids for action_type, newest first."""
+        ...
+
+    @abstractmethod
+    async def save_post_snapshot(self, post: Post) -> None:
+        """Remember one of our own posts so replies don't need to re-fetch it."""
+        ...
+
+    @abstractmethod
+    async def get_post_snapshot(self, post_id: str) -> Post | None: ...
+
+    @abstractmethod
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        """Group writes; implementations may defer persistence until exit."""
+        ...
+
     @abstractmethod
     async def close(self) -> None: ...
 
@@ -56,8 +97,10 @@ class AbstractContentAnalyzer(ABC):
 
     @abstractmethod
     async def filter_checkable(
-        self, posts: list[Post]
-    ) -> list[tuple[Post, AnalysisResult]]: ...
+        self, posts: list[Post], limit: int | None = None
+    ) -> list[tuple[Post, AnalysisResult]]:
+        """Return checkable posts in order, stopping once `limit` are found."""
+        ...
 
 
 class AbstractFactChecker(ABC):
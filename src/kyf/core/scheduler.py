@@ -3,10 +3,8 @@
 Single Responsibility: only handles scheduling, delegates execution to the agent.
 """
 
-from datetime import datetime, timedelta
-
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
+import asyncio
+import contextlib
 
 from kyf.core.agent import KYFAgent
 from kyf.logger import get_logger
@@ -15,34 +13,45 @@ logger = get_logger(__name__)
 
 
 class HeartbeatScheduler:
-    """Schedules the agent heartbeat at a configurable interval."""
+    """Schedules the agent heartbeat at a configurable interval.
+
+    A single asyncio task — heartbeats run one at a time, and a heartbeat
+    that overruns its interval is followed immediately by one more run
+    (missed runs collapse into one).
+    """
 
     def __init__(self, agent: KYFAgent, interval_hours: int = 4) -> None:
         self._agent = agent
         self._interval_hours = interval_hours
-        self._scheduler = AsyncIOScheduler()
+        self._task: asyncio.Task[None] | None = None
 
     def start(self) -> None:
-        """Start the scheduler. The first run is manual; recurring runs are automatic."""
-        # Schedule recurring runs starting after the interval
-        # (the first heartbeat is triggered manually via run_initial_heartbeat)
-        first_scheduled = datetime.now() + timedelta(hours=self._interval_hours)
-        self._scheduler.add_job(
-            self._agent.run_heartbeat,
-            trigger=IntervalTrigger(hours=self._interval_hours),
-            id="kyf_heartbeat",
-            name="KYF Heartbeat",
-            next_run_time=first_scheduled,
-        )
-        self._scheduler.start()
+        """Start the scheduler. The first heartbeat runs right away, inside the task."""
+        # Running it in the task means stop() can cancel it and its
+        # failures are logged like any other run's
+        self._task = asyncio.create_task(self._loop(), name="kyf_heartbeat")
         logger.info("scheduler_started", interval_hours=self._interval_hours)
 
-    async def run_initial_heartbeat(self) -> None:
-        """Run the first heartbeat immediately on startup."""
+    async def _loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        interval = self._interval_hours * 3600
+        next_run = loop.time()
         logger.info("initial_heartbeat_triggered")
-        await self._agent.run_heartbeat()
-
-    def stop(self) -> None:
-        """Stop the scheduler gracefully."""
-        self._scheduler.shutdown(wait=False)
+        while True:
+            await asyncio.sleep(max(0.0, next_run - loop.time()))
+            try:
+                await self._agent.run_heartbeat()
+            except Exception as e:
+                logger.error("heartbeat_job_failed", error=str(e))
+
+            # Fixed rate; after an overrun, skip ahead rather than run a backlog
+            next_run = max(next_run + interval, loop.time())
+
+    async def stop(self) -> None:
+        """Stop the scheduler; an in-flight heartbeat is cancelled and unwinds its cleanup."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
         logger.info("scheduler_stopped")
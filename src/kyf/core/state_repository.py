@@ -1,21 +1,40 @@
 """File-based state persistence using JSON + JSONL.
 
 Implements AbstractStateRepository.
-- state.json: agent state (seen posts, counters) — overwritten each save
+Appends (action log, ID logs) go through AsyncArtifactWriter; other reads and
+writes run in asyncio.to_thread so disk I/O never blocks the event loop.
+- state.json: agent state (counters) — overwritten each save
 - actions.jsonl: append-only action log — one JSON object per line
+- seen_posts.jsonl / replied_comments.jsonl: append-only ID logs — one ID per line
+- own_posts.json: title + body excerpt of posts we created, keyed by post ID
 """
 
 import asyncio
-import json
-from datetime import datetime, date
+from collections import Counter, deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timezone
 from pathlib import Path
 
+import orjson
+
+from kyf.core.async_writer import AsyncArtifactWriter
 from kyf.core.interfaces import AbstractStateRepository
 from kyf.logger import get_logger
 from kyf.models.agent_state import ActionLog, ActionType, AgentState
+from kyf.models.moltbook import Post
 
 logger = get_logger(__name__)
 
+# Own-post snapshots kept in own_posts.json — the reply phase only reads the
+# 10 most recent posts, so older ones would just grow every rewrite
+_MAX_POST_SNAPSHOTS = 20
+
+
+def _utc_today() -> date:
+    # ActionLog.created_at is UTC, so "today" must be the UTC date too
+    return datetime.now(timezone.utc).date()
+
 
 class FileStateRepository(AbstractStateRepository):
     """Persists agent state to JSON files on disk."""
@@ -24,28 +43,44 @@ class FileStateRepository(AbstractStateRepository):
         self._data_dir = Path(data_dir)
         self._state_path = self._data_dir / "state.json"
         self._actions_path = self._data_dir / "actions.jsonl"
-        self._seen_path = self._data_dir / "seen_posts.json"
-        self._replied_path = self._data_dir / "replied_comments.json"
+        self._seen_path = self._data_dir / "seen_posts.jsonl"
+        self._replied_path = self._data_dir / "replied_comments.jsonl"
+        self._own_posts_path = self._data_dir / "own_posts.json"
         self._lock = asyncio.Lock()
+        self._writer = AsyncArtifactWriter()
         self._seen_ids: set[str] = set()
+        # Parsed once on first load_state, then kept current by save_state
+        self._state: AgentState | None = None
         self._replied_ids: set[str] = set()
+        self._own_posts: dict[str, dict[str, str]] = {}
+        # Today's action counts by action_type — seeded by one scan, bumped by log_action
+        self._today_counts: Counter[str] = Counter()
+        self._counts_date = _utc_today()
+        # Lines on disk per ID log; compacted on close once it passes 2x the unique IDs
+        self._seen_lines = 0
+        self._replied_lines = 0
+        # Inside transaction(), new IDs are buffered and appended on exit
+        self._tx_depth = 0
+        self._seen_pending: list[str] = []
+        self._replied_pending: list[str] = []
 
     async def initialize(self) -> None:
         self._data_dir.mkdir(parents=True, exist_ok=True)
 
-        # Load seen post IDs into memory for fast lookup
-        if self._seen_path.exists():
-            raw = self._seen_path.read_text(encoding="utf-8")
-            self._seen_ids = set(json.loads(raw)) if raw.strip() else set()
+        # Load seen post / replied comment IDs into memory for fast lookup
+        self._seen_ids, self._seen_lines = self._load_ids(self._seen_path)
+        self._replied_ids, self._replied_lines = self._load_ids(self._replied_path)
 
-        # Load replied comment IDs into memory for fast lookup
-        if self._replied_path.exists():
-            raw = self._replied_path.read_text(encoding="utf-8")
-            self._replied_ids = set(json.loads(raw)) if raw.strip() else set()
+        # Load own-post snapshots (reply-prompt context)
+        if self._own_posts_path.exists():
+            raw = self._own_posts_path.read_bytes()
+            self._own_posts = orjson.loads(raw) if raw.strip() else {}
 
-        # Ensure action log file exists
+        # Ensure action log file exists, else seed today's counts from it
         if not self._actions_path.exists():
             self._actions_path.touch()
+        else:
+            self._today_counts = self._scan_today_counts()
 
         logger.info("file_state_initialized", data_dir=str(self._data_dir))
 
@@ -53,100 +88,251 @@ class FileStateRepository(AbstractStateRepository):
 
     async def load_state(self) -> AgentState:
         async with self._lock:
-            if not self._state_path.exists():
-                return AgentState(seen_post_ids=self._seen_ids)
-
-            raw = self._state_path.read_text(encoding="utf-8")
-            if not raw.strip():
-                return AgentState(seen_post_ids=self._seen_ids)
-
-            state = AgentState.model_validate_json(raw)
-            state.seen_post_ids = self._seen_ids
+            if self._state is not None:
+                return self._state
+
+            raw = ""
+            if self._state_path.exists():
+                raw = await asyncio.to_thread(self._state_path.read_text, encoding="utf-8")
+            state = AgentState.model_validate_json(raw) if raw.strip() else AgentState()
+            self._state = state
             return state
 
     async def save_state(self, state: AgentState) -> None:
         async with self._lock:
-            # Save state (without seen_ids — those live in their own file)
-            state_data = state.model_dump(exclude={"seen_post_ids"})
-            self._state_path.write_text(
-                json.dumps(state_data, indent=2, default=str),
-                encoding="utf-8",
-            )
+            self._state = state
+            # Compact — state.json is machine-read only
+            state_data = state.model_dump(mode="json")
+            await asyncio.to_thread(self._state_path.write_bytes, orjson.dumps(state_data))
+
+    # --- ID Logs (seen posts, replied comments) ---
+    # Marks take no lock: check-add-enqueue has no await, so it can't interleave,
+    # and the writer thread is the only thing touching the file
+
+    @staticmethod
+    def _load_ids(path: Path) -> tuple[set[str], int]:
+        """Read an ID log; returns the unique IDs and the line count on disk.
+
+        A JSON-array file from before the log format is migrated in place.
+        """
+        legacy = path.with_suffix(".json")
+        if not path.exists() and legacy.exists():
+            raw = legacy.read_text(encoding="utf-8")
+            ids = set(orjson.loads(raw)) if raw.strip() else set()
+            FileStateRepository._rewrite_ids(path, ids)
+            legacy.unlink()
+            return ids, len(ids)
+
+        if not path.exists():
+            return set(), 0
+        lines = [line for line in path.read_text(encoding="utf-8").splitlines() if line]
+        return set(lines), len(lines)
+
+    def _append_ids(self, path: Path, ids: list[str]) -> None:
+        self._writer.append(path, "".join(f"{i}\n" for i in ids))
+
+    @staticmethod
+    def _rewrite_ids(path: Path, ids: set[str]) -> None:
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text("".join(f"{i}\n" for i in ids), encoding="utf-8")
+        tmp.replace(path)
 
     # --- Seen Posts ---
 
+    def _persist_seen(self, new_ids: list[str]) -> None:
+        if self._tx_depth:
+            self._seen_pending.extend(new_ids)
+            return
+        self._append_ids(self._seen_path, new_ids)
+        self._seen_lines += len(new_ids)
+
     async def mark_post_seen(self, post_id: str) -> None:
-        async with self._lock:
-            self._seen_ids.add(post_id)
-            self._seen_path.write_text(
-                json.dumps(list(self._seen_ids)),
-                encoding="utf-8",
-            )
+        if post_id in self._seen_ids:
+            return
+        self._seen_ids.add(post_id)
+        self._persist_seen([post_id])
 
     async def is_post_seen(self, post_id: str) -> bool:
         return post_id in self._seen_ids
 
+    async def filter_unseen(self, post_ids: list[str]) -> list[str]:
+        # dict.fromkeys de-duplicates while keeping feed order
+        return [pid for pid in dict.fromkeys(post_ids) if pid not in self._seen_ids]
+
+    async def mark_seen_bulk(self, post_ids: list[str]) -> None:
+        new_ids = [pid for pid in dict.fromkeys(post_ids) if pid not in self._seen_ids]
+        if not new_ids:
+            return
+        self._seen_ids.update(new_ids)
+        self._persist_seen(new_ids)
+
     # --- Replied Comments ---
 
+    def _persist_replied(self, new_ids: list[str]) -> None:
+        if self._tx_depth:
+            self._replied_pending.extend(new_ids)
+            return
+        self._append_ids(self._replied_path, new_ids)
+        self._replied_lines += len(new_ids)
+
     async def mark_comment_replied(self, comment_id: str) -> None:
-        async with self._lock:
-            self._replied_ids.add(comment_id)
-            self._replied_path.write_text(
-                json.dumps(list(self._replied_ids)),
-                encoding="utf-8",
-            )
+        if comment_id in self._replied_ids:
+            return
+        self._replied_ids.add(comment_id)
+        self._persist_replied([comment_id])
 
     async def is_comment_replied(self, comment_id: str) -> bool:
         return comment_id in self._replied_ids
 
-    # --- Action Log (JSONL append-only) ---
+    async def get_replied_comment_ids(self, comment_ids: list[str]) -> set[str]:
+        return self._replied_ids.intersection(comment_ids)
 
-    async def log_action(self, action: ActionLog) -> None:
+    # --- Own Post Snapshots ---
+
+    async def save_post_snapshot(self, post: Post) -> None:
+        # Only what the comment-reply prompt uses: title + 500-char body excerpt
         async with self._lock:
-            line = json.dumps({
+            self._own_posts.pop(post.id, None)  # re-insert at the newest end
+            self._own_posts[post.id] = {
+                "id": post.id,
+                "title": post.title,
+                "body": (post.body or "")[:500],
+            }
+            # Dicts keep insertion order, so the oldest snapshots come first
+            for stale in list(self._own_posts)[:-_MAX_POST_SNAPSHOTS]:
+                del self._own_posts[stale]
+            await asyncio.to_thread(self._own_posts_path.write_bytes, orjson.dumps(self._own_posts))
+
+    async def get_post_snapshot(self, post_id: str) -> Post | None:
+        snapshot = self._own_posts.get(post_id)
+        return Post.model_validate(snapshot) if snapshot is not None else None
+
+    # --- Action Log (JSONL append-only) ---
+
+    @staticmethod
+    def _action_line(action: ActionLog) -> str:
+        # orjson writes datetimes as ISO-8601 natively
+        return orjson.dumps(
+            {
                 "action_type": action.action_type.value,
                 "target_id": action.target_id,
                 "details": action.details,
-                "created_at": action.created_at.isoformat(),
-            })
-            with self._actions_path.open("a", encoding="utf-8") as f:
-                f.write(line + "\n")
+                "created_at": action.created_at,
+            },
+            option=orjson.OPT_APPEND_NEWLINE,
+        ).decode()
+
+    def _scan_today_counts(self) -> Counter[str]:
+        counts: Counter[str] = Counter()
+        today = self._counts_date.isoformat()
+        # Separator-agnostic prefilter on raw bytes: older lines were written by json.dumps
+        marker = f'"{today}'.encode()
+        with self._actions_path.open("rb") as f:
+            for line in f:
+                if marker not in line:
+                    continue
+                entry = orjson.loads(line)
+                if entry.get("created_at", "").startswith(today):
+                    counts[entry["action_type"]] += 1
+        return counts
+
+    def _roll_counts(self) -> date:
+        today = _utc_today()
+        if today != self._counts_date:
+            self._today_counts.clear()
+            self._counts_date = today
+        return today
+
+    def _count_actions(self, actions: list[ActionLog]) -> None:
+        today = self._roll_counts()
+        for action in actions:
+            if action.created_at.date() == today:
+                self._today_counts[action.action_type.value] += 1
+
+    async def log_action(self, action: ActionLog) -> None:
+        self._count_actions([action])
+        self._writer.append(self._actions_path, self._action_line(action))
+
+    async def log_actions_bulk(self, actions: list[ActionLog]) -> None:
+        if not actions:
+            return
+        self._count_actions(actions)
+        self._writer.append(self._actions_path, "".join(self._action_line(a) for a in actions))
 
     async def get_today_action_count(self, action_type: ActionType) -> int:
-        today = date.today().isoformat()
-        count = 0
+        self._roll_counts()
+        return self._today_counts[action_type.value]
 
+    async def get_action_target_ids(self, action_type: ActionType) -> list[str]:
+        """Return all target_ids for a given action type from the action log."""
         if not self._actions_path.exists():
-            return 0
-
+            return []
+        await self._writer.flush()
         async with self._lock:
-            for line in self._actions_path.read_text(encoding="utf-8").splitlines():
-                if not line.strip():
-                    continue
-                entry = json.loads(line)
-                if (
-                    entry.get("action_type") == action_type.value
-                    and entry.get("created_at", "").startswith(today)
-                ):
-                    count += 1
+            ids = await asyncio.to_thread(self._tail_target_ids, action_type, None)
+        return list(ids)
 
-        return count
+    async def get_recent_action_target_ids(
+        self, action_type: ActionType, limit: int
+    ) -> list[str]:
+        """Return the last `limit` target_ids for an action type, newest first.
 
-    async def get_action_target_ids(self, action_type: ActionType) -> list[str]:
-        """Return all target_ids for a given action type from the action log."""
-        ids: list[str] = []
+        Streams the log keeping only a bounded window, and skips parsing lines
+        that can't match.
+        """
         if not self._actions_path.exists():
-            return ids
+            return []
+        await self._writer.flush()
         async with self._lock:
-            for line in self._actions_path.read_text(encoding="utf-8").splitlines():
-                if not line.strip():
+            recent = await asyncio.to_thread(self._tail_target_ids, action_type, limit)
+        return list(reversed(recent))
+
+    def _tail_target_ids(self, action_type: ActionType, limit: int | None) -> deque[str]:
+        # Streams line by line; limit=None keeps every match
+        recent: deque[str] = deque(maxlen=limit)
+        marker = f'"{action_type.value}"'.encode()
+        with self._actions_path.open("rb") as f:
+            for line in f:
+                if marker not in line:
                     continue
-                entry = json.loads(line)
+                entry = orjson.loads(line)
                 if entry.get("action_type") == action_type.value and entry.get("target_id"):
-                    ids.append(entry["target_id"])
-        return ids
+                    recent.append(entry["target_id"])
+        return recent
+
+    # --- Transactions ---
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Coalesce seen/replied appends into one write per file on exit.
+
+        Writes are flushed even if the block raises, so nothing marked in
+        memory is lost short of a hard crash.
+        """
+        self._tx_depth += 1
+        try:
+            yield
+        finally:
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                async with self._lock:
+                    if self._seen_pending:
+                        pending, self._seen_pending = self._seen_pending, []
+                        self._persist_seen(pending)
+                    if self._replied_pending:
+                        pending, self._replied_pending = self._replied_pending, []
+                        self._persist_replied(pending)
 
     # --- Lifecycle ---
 
     async def close(self) -> None:
+        await self._writer.close()
+        async with self._lock:
+            # Lines only duplicate after a crash or hand edit, so this rarely fires
+            if self._seen_lines > 2 * len(self._seen_ids):
+                self._rewrite_ids(self._seen_path, self._seen_ids)
+                self._seen_lines = len(self._seen_ids)
+            if self._replied_lines > 2 * len(self._replied_ids):
+                self._rewrite_ids(self._replied_path, self._replied_ids)
+                self._replied_lines = len(self._replied_ids)
         logger.info("file_state_closed")
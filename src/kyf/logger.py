@@ -8,6 +8,13 @@ import structlog
 
 def setup_logging(log_level: str = "INFO") -> None:
     """Configure structured JSON logging."""
+    if sys.stderr.isatty():
+        # ConsoleRenderer pretty-prints exc_info itself
+        renderers: list[structlog.types.Processor] = [structlog.dev.ConsoleRenderer()]
+    else:
+        # JSONRenderer can't serialize exc_info — render the traceback to a string first
+        renderers = [structlog.processors.format_exc_info, structlog.processors.JSONRenderer()]
+
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
@@ -15,9 +22,7 @@ def setup_logging(log_level: str = "INFO") -> None:
             structlog.processors.StackInfoRenderer(),
             structlog.dev.set_exc_info,
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.dev.ConsoleRenderer()
-            if sys.stderr.isatty()
-            else structlog.processors.JSONRenderer(),
+            *renderers,
         ],
         wrapper_class=structlog.make_filtering_bound_logger(
             getattr(logging, log_level.upper(), logging.INFO)
@@ -7,13 +7,14 @@ This is the ONLY place that knows about concrete classes.
 import asyncio
 import signal
 
-from kyf.clients.llm_client import GroqClient
+from kyf.clients.llm_client import GroqClient, LLMClient
 from kyf.clients.moltbook_client import MoltbookClient
 from kyf.config import load_settings
 from kyf.core.agent import KYFAgent
 from kyf.core.scheduler import HeartbeatScheduler
 from kyf.core.state_repository import FileStateRepository
 from kyf.logger import get_logger, setup_logging
+from kyf.models.llm import LLMConfig
 from kyf.services.content_analyzer import ContentAnalyzerService
 from kyf.services.fact_checker import FactCheckerService
 from kyf.services.post_creator import PostCreatorService
@@ -32,7 +33,14 @@ async def main() -> None:
         api_key=settings.moltbook_api_key,
     )
 
-    llm = GroqClient(api_key=settings.groq_api_key)
+    llm_config = LLMConfig(model=settings.groq_model, temperature=settings.groq_temperature)
+    logger.info(
+        "llm_configured",
+        model=llm_config.model,
+        temperature=llm_config.temperature,
+        response_cache=llm_config.temperature == 0,
+    )
+    llm: LLMClient = GroqClient(api_key=settings.groq_api_key, config=llm_config)
 
     state_repo = FileStateRepository(data_dir=settings.db_path)
     await state_repo.initialize()
@@ -64,12 +72,18 @@ async def main() -> None:
     # --- Graceful shutdown ---
     shutdown_event = asyncio.Event()
 
-    def _signal_handler(sig: int, frame: object) -> None:
-        logger.info("shutdown_signal_received", signal=sig)
+    def _signal_handler(sig: signal.Signals) -> None:
+        # Runs as a regular loop callback, so logging here is safe
+        logger.info("shutdown_signal_received", signal=sig.name)
         shutdown_event.set()
 
-    signal.signal(signal.SIGINT, _signal_handler)
-    signal.signal(signal.SIGTERM, _signal_handler)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, _signal_handler, sig)
+        except NotImplementedError:
+            # Windows event loops have no add_signal_handler
+            signal.signal(sig, lambda s, _f: loop.call_soon_threadsafe(_signal_handler, signal.Signals(s)))
 
     # --- Subscribe to submolts for personalized feed ---
     target_submolts = ["science", "ai-ethics", "economics", "finance", "health", "selfimprovement", "random", "general"]
@@ -83,11 +97,10 @@ async def main() -> None:
     # --- Run ---
     try:
         scheduler.start()
-        await scheduler.run_initial_heartbeat()
         logger.info("kyf_running", interval=f"every {settings.heartbeat_interval_hours}h")
         await shutdown_event.wait()
     finally:
-        scheduler.stop()
+        await scheduler.stop()
         await agent.shutdown()
         logger.info("kyf_stopped")
 
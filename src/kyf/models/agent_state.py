@@ -1,9 +1,10 @@
-"""Pydantic models for agent internal state tracking."""
+"""Models for agent internal state tracking."""
 
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from enum import StrEnum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 
 class ActionType(StrEnum):
@@ -18,31 +19,28 @@ class ActionType(StrEnum):
     PROFILE_UPDATED = "profile_updated"
 
 
-class ActionLog(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ActionLog:
+    """Audit-log entry. Built only from trusted internal values, so no validation."""
+
     id: int | None = None
     action_type: ActionType
     target_id: str | None = None
     details: str | None = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 class AgentState(BaseModel):
+    """Small scalar counters only; seen IDs live in the state repository."""
+
     last_heartbeat: datetime | None = None
     posts_today: int = 0
     comments_today: int = 0
     last_post_at: datetime | None = None
     last_comment_at: datetime | None = None
-    seen_post_ids: set[str] = Field(default_factory=set)
-    subscribed_submolts: set[str] = Field(default_factory=set)
 
     def can_post(self, max_posts_per_day: int) -> bool:
         return self.posts_today < max_posts_per_day
 
     def can_comment(self, max_comments_per_day: int) -> bool:
         return self.comments_today < max_comments_per_day
-
-    def mark_post_seen(self, post_id: str) -> None:
-        self.seen_post_ids.add(post_id)
-
-    def is_post_seen(self, post_id: str) -> bool:
-        return post_id in self.seen_post_ids
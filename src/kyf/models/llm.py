@@ -7,6 +7,9 @@ class LLMConfig(BaseModel):
     model: str = "llama-3.3-70b-versatile"
     temperature: float = Field(default=0.8, ge=0.0, le=2.0)
     max_output_tokens: int = Field(default=1024, gt=0)
+    # Keep static instructions in the system message so provider-side
+    # prefix caching can reuse them across calls
+    cache_system_prompt: bool = True
 
 
 class AnalysisResult(BaseModel):
@@ -18,6 +21,18 @@ class AnalysisResult(BaseModel):
     reasoning: str | None = None
 
 
+class BatchAnalysisItem(AnalysisResult):
+    """One post's verdict in a batched analysis, matched back by its 1-based index."""
+
+    index: int
+
+
+class BatchAnalysisResult(BaseModel):
+    """Result of analyzing several posts in one LLM call."""
+
+    results: list[BatchAnalysisItem] = Field(default_factory=list)
+
+
 class FactCheckResponse(BaseModel):
     """Generated fact-check reply to a post."""
 
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import StrEnum
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, Field, HttpUrl, model_validator
+from pydantic import BaseModel, Field, model_validator
 
 
 class VoteDirection(StrEnum):
@@ -62,6 +62,22 @@ class Submolt(BaseModel):
     created_at: datetime | None = None
 
 
+def _normalize_body_and_author(data: dict[str, Any]) -> None:
+    """Flatten the API's 'content' and nested 'author' in place (posts and comments)."""
+    # content -> body
+    if "content" in data and "body" not in data:
+        data["body"] = data.pop("content")
+
+    # nested author -> author_name
+    author = data.get("author")
+    if isinstance(author, dict):
+        data["author_name"] = author.get("name")
+        del data["author"]
+    elif isinstance(author, str):
+        data["author_name"] = author
+        del data["author"]
+
+
 class Post(BaseModel):
     """Moltbook post.
 
@@ -91,18 +107,7 @@ class Post(BaseModel):
         if not isinstance(data, dict):
             return data
 
-        # content -> body
-        if "content" in data and "body" not in data:
-            data["body"] = data.pop("content")
-
-        # nested author -> author_name
-        author = data.get("author")
-        if isinstance(author, dict):
-            data["author_name"] = author.get("name")
-            data.pop("author", None)
-        elif isinstance(author, str):
-            data["author_name"] = author
-            data.pop("author", None)
+        _normalize_body_and_author(data)
 
         # nested submolt -> submolt (string name)
         submolt = data.get("submolt")
@@ -126,25 +131,13 @@ class Comment(BaseModel):
     def score(self) -> int:
         return self.upvotes - self.downvotes
 
-    @model_validator(mode="before") #validate the data before validation (before instantiation) 
-    @classmethod #to mkae method, to belong to class instead of its ojb (self)
+    @model_validator(mode="before")
+    @classmethod
     def _normalize_api_response(cls, data: Any) -> Any:
-        if not isinstance(data, dict): # if data is not instance of dict
+        if not isinstance(data, dict):
             return data
 
-        # content -> body
-        if "content" in data and "body" not in data:
-            data["body"] = data.pop("content")
-
-        # nested author -> author_name
-        author = data.get("author")
-        if isinstance(author, dict):
-            data["author_name"] = author.get("name")
-            data.pop("author", None)
-        elif isinstance(author, str):
-            data["author_name"] = author
-            data.pop("author", None)
-
+        _normalize_body_and_author(data)
         return data
 
 
@@ -4,23 +4,40 @@ Single Responsibility: only handles claim detection logic.
 Depends on LLMClient abstraction, not a concrete provider.
 """
 
-from kyf.clients.llm_client import LLMClient
+import asyncio
+import re
+
+from kyf.clients.llm_client import LLMClient, LLMRateLimitError
 from kyf.core.interfaces import AbstractContentAnalyzer
 from kyf.logger import get_logger
-from kyf.models.llm import AnalysisResult
+from kyf.models.llm import AnalysisResult, BatchAnalysisResult
 from kyf.models.moltbook import Post
 from kyf.prompts.templates import PromptTemplates
 from kyf.utils.sanitizer import InputSanitizer
 
 logger = get_logger(__name__)
 
+# Posts classified per LLM call — bounded so every verdict fits in the
+# default 1024-token output budget
+_ANALYZE_BATCH_SIZE = 8
+# Per-post body cap inside a batch prompt, so one long post can't crowd out the rest
+_BATCH_BODY_CHARS = 2000
+# Posts shorter than this with no claim signal ("gm", "hello moltbook!") skip the LLM
+_MIN_UNSIGNALLED_CHARS = 50
+_CLAIM_SIGNAL = re.compile(
+    r"\d|%|\b(?:is|was|are|were|causes?|proven|stud(?:y|ies)|percent|research|according)\b",
+    re.IGNORECASE,
+)
+
 
 class ContentAnalyzerService(AbstractContentAnalyzer):
     """Analyzes posts to determine if they contain fact-checkable claims."""
 
-    def __init__(self, llm: LLMClient, min_confidence: float = 0.6) -> None:
+    def __init__(self, llm: LLMClient, min_confidence: float = 0.6, concurrency: int = 2) -> None:
         self._llm = llm
         self._min_confidence = min_confidence
+        # Batch calls in flight at once; kept low for Groq's free-tier RPM
+        self._concurrency = concurrency
 
     async def analyze(self, post: Post) -> AnalysisResult:
         """Analyze a single post for checkable claims."""
@@ -48,22 +65,112 @@ class ContentAnalyzerService(AbstractContentAnalyzer):
             return result
 
         except Exception as e:
-            logger.error("analysis_failed", post_id=post.id, error=str(e))
-            return AnalysisResult(has_checkable_claim=False, reasoning=f"Analysis error: {e}")
+            logger.error("analysis_failed", post_id=post.id, exc_info=True)
+            return AnalysisResult(
+                has_checkable_claim=False, reasoning=f"Analysis error: {type(e).__name__}"
+            )
 
-    async def filter_checkable(self, posts: list[Post]) -> list[tuple[Post, AnalysisResult]]:
-        """Filter a list of posts down to those with high-confidence checkable claims."""
-        results: list[tuple[Post, AnalysisResult]] = []
+    async def analyze_batch(self, posts: list[Post]) -> list[AnalysisResult]:
+        """Analyze several posts with one LLM call; results follow input order.
+
+        Posts the response leaves out (or a failed batch call) fall back to a
+        single-post analyze(). LLMRateLimitError propagates — retrying per
+        post against an exhausted quota would only multiply the failures.
+        """
+        items = "\n\n".join(
+            PromptTemplates.ANALYZE_POSTS_BATCH_ITEM.format(
+                index=i,
+                title=InputSanitizer.sanitize(post.title),
+                # Slice after sanitizing so this hits the cache filter_checkable filled
+                body=InputSanitizer.sanitize(post.body or "")[:_BATCH_BODY_CHARS],
+                submolt=post.submolt or "general",
+            )
+            for i, post in enumerate(posts, start=1)
+        )
+        prompt = PromptTemplates.ANALYZE_POSTS_BATCH.format(posts=items)
+
+        by_index: dict[int, AnalysisResult] = {}
+        try:
+            raw = await self._llm.generate_json(
+                system_prompt=PromptTemplates.SYSTEM_PERSONA,
+                user_prompt=prompt,
+            )
+            for item in BatchAnalysisResult.model_validate(raw).results:
+                by_index[item.index] = AnalysisResult.model_validate(
+                    item.model_dump(exclude={"index"})
+                )
+        except LLMRateLimitError:
+            raise
+        except Exception:
+            logger.warning("batch_analysis_failed", batch_size=len(posts), exc_info=True)
+
+        results: list[AnalysisResult] = []
+        for i, post in enumerate(posts, start=1):
+            result = by_index.get(i)
+            if result is None:
+                result = await self.analyze(post)
+            else:
+                logger.info(
+                    "post_analyzed",
+                    post_id=post.id,
+                    has_claim=result.has_checkable_claim,
+                    confidence=result.confidence,
+                )
+            results.append(result)
+        return results
+
+    @staticmethod
+    def _may_have_claim(post: Post) -> bool:
+        """Cheap local gate: only short posts with no claim signal are ruled out."""
+        text = f"{post.title} {post.body or ''}"
+        return len(text) >= _MIN_UNSIGNALLED_CHARS or _CLAIM_SIGNAL.search(text) is not None
+
+    async def filter_checkable(
+        self, posts: list[Post], limit: int | None = None
+    ) -> list[tuple[Post, AnalysisResult]]:
+        """Filter a list of posts down to those with high-confidence checkable claims.
+
+        Posts are classified _ANALYZE_BATCH_SIZE per LLM call, with up to
+        `concurrency` batch calls in flight. Stops once `limit` are found —
+        posts past the caller's comment budget would only cost LLM calls.
+        """
+        candidates: list[Post] = []
         for post in posts:
-            if InputSanitizer.is_suspicious(post.title) or InputSanitizer.is_suspicious(
-                post.body or ""
-            ):
+            # scan() sanitizes as it checks; analyze_batch reuses the cached result
+            if InputSanitizer.scan(post.title)[1] or InputSanitizer.scan(post.body or "")[1]:
                 logger.warning("suspicious_post_skipped", post_id=post.id)
                 continue
+            if not self._may_have_claim(post):
+                logger.debug("trivial_post_skipped", post_id=post.id)
+                continue
+            candidates.append(post)
+
+        batches = [
+            candidates[i : i + _ANALYZE_BATCH_SIZE]
+            for i in range(0, len(candidates), _ANALYZE_BATCH_SIZE)
+        ]
+        results: list[tuple[Post, AnalysisResult]] = []
+        for start in range(0, len(batches), self._concurrency):
+            if limit is not None and len(results) >= limit:
+                break
 
-            analysis = await self.analyze(post)
-            if analysis.has_checkable_claim and analysis.confidence >= self._min_confidence:
-                results.append((post, analysis))
+            wave = batches[start : start + self._concurrency]
+            tasks = [asyncio.create_task(self.analyze_batch(b)) for b in wave]
+            try:
+                analyses = await asyncio.gather(*tasks)
+            except BaseException:
+                # Usually LLMRateLimitError: stop sibling batches (and their
+                # per-post fallbacks) from spending quota after the agent backs off
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            for batch, batch_analyses in zip(wave, analyses):
+                for post, analysis in zip(batch, batch_analyses):
+                    if analysis.has_checkable_claim and analysis.confidence >= self._min_confidence:
+                        results.append((post, analysis))
 
+        if limit is not None:
+            results = results[:limit]
         logger.info("filter_complete", total=len(posts), checkable=len(results))
         return results
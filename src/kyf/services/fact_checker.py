@@ -28,13 +28,13 @@ class FactCheckerService(AbstractFactChecker):
         # which could have been influenced by a crafted post to smuggle
         # injection payloads into this second LLM call.
         raw_claim = analysis.claim_summary or "unspecified claim"
-        if InputSanitizer.is_suspicious(raw_claim):
+        sanitized_claim, claim_suspicious = InputSanitizer.scan(raw_claim)
+        if claim_suspicious:
             logger.warning(
                 "suspicious_claim_summary",
                 post_id=post.id,
                 raw_claim=raw_claim[:200],
             )
-        sanitized_claim = InputSanitizer.sanitize(raw_claim)
 
         prompt = PromptTemplates.FACT_CHECK_REPLY.format(
             title=sanitized_title,
@@ -55,6 +55,7 @@ class FactCheckerService(AbstractFactChecker):
             )
             return response
 
-        except Exception as e:
-            logger.error("fact_check_failed", post_id=post.id, error=str(e))
+        except Exception:
+            # exc_info defers rendering (a ValidationError can be KBs) to the log pipeline
+            logger.error("fact_check_failed", post_id=post.id, exc_info=True)
             raise
@@ -13,7 +13,7 @@ from kyf.prompts.templates import PromptTemplates
 
 logger = get_logger(__name__)
 
-TOPIC_CATEGORIES = [
+TOPIC_CATEGORIES = (
     "tech_and_ai_hype",
     "startup_myths",
     "popular_science",
@@ -21,7 +21,7 @@ TOPIC_CATEGORIES = [
     "crypto_and_finance",
     "health_and_wellness",
     "journalism_and_media",
-]
+)
 
 CATEGORY_TO_SUBMOLT: dict[str, str] = {
     "tech_and_ai_hype": "ai-ethics",
@@ -67,6 +67,6 @@ class PostCreatorService(AbstractPostCreator):
             )
             return content
 
-        except Exception as e:
-            logger.error("post_creation_failed", category=topic, error=str(e))
+        except Exception:
+            logger.error("post_creation_failed", category=topic, exc_info=True)
             raise
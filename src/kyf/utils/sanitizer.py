@@ -4,6 +4,7 @@ Handles direct instruction injection, Unicode homoglyph evasion,
 and LLM-output-to-LLM-input smuggling.
 """
 
+import functools
 import re
 import unicodedata
 
@@ -49,6 +50,15 @@ class InputSanitizer:
         re.compile(r"your\s+(response|output|reply)\s+must\s+(be|start|begin|contain)", re.IGNORECASE),
     ]
 
+    # Case-sensitive twins for ASCII text matched against text.lower(): the
+    # engine's literal-prefix scan only works without IGNORECASE. Derived by
+    # lowercasing the sources, so patterns must not use uppercase escapes (\S, \W...).
+    # Non-ASCII text keeps the IGNORECASE set — re folds a few non-ASCII
+    # letters (e.g. dotless 'ı') onto ASCII ones, which str.lower() doesn't.
+    _ASCII_PATTERNS: list[re.Pattern[str]] = [
+        re.compile(p.pattern.lower(), p.flags & ~re.IGNORECASE) for p in _INJECTION_PATTERNS
+    ]
+
     _MAX_CONTENT_LENGTH = 10_000
 
     @classmethod
@@ -59,25 +69,71 @@ class InputSanitizer:
         fullwidth 'ｉｇｎｏｒｅ' -> 'ignore') so regex patterns match
         regardless of character encoding tricks.
         """
+        # NFKC leaves pure ASCII unchanged — skip the table walk and copy
+        if text.isascii():
+            return text
         return unicodedata.normalize("NFKC", text)
 
     @classmethod
-    def sanitize(cls, text: str) -> str:
-        """Remove prompt injection patterns and truncate overly long content.
+    def scan(cls, text: str) -> tuple[str, bool]:
+        """Sanitize and flag in one pass: returns (sanitized_text, was_suspicious).
 
-        Applies Unicode normalization before pattern matching to prevent
-        homoglyph-based evasion.
+        The flag covers the truncated text — the part that can reach the LLM.
+        Memoized: a post's title and body are re-sanitized for every comment
+        reply on it, and sanitize() shares this cache.
         """
         if not text:
-            return text
+            return text, False
+        # Truncate before the cache, so an entry never pins more than the limit
+        return cls._scan_truncated(text[: cls._MAX_CONTENT_LENGTH])
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _scan_truncated(text: str) -> tuple[str, bool]:
+        text = InputSanitizer._normalize_unicode(text)
+        if text.isascii():
+            return InputSanitizer._scan_ascii(text)
 
-        text = text[: cls._MAX_CONTENT_LENGTH]
-        text = cls._normalize_unicode(text)
+        suspicious = False
+        for pattern in InputSanitizer._INJECTION_PATTERNS:
+            text, count = pattern.subn("[FILTERED]", text)
+            suspicious = suspicious or count > 0
 
-        for pattern in cls._INJECTION_PATTERNS:
-            text = pattern.sub("[FILTERED]", text)
+        return text.strip(), suspicious
+
+    @classmethod
+    def _scan_ascii(cls, text: str) -> tuple[str, bool]:
+        """scan() for ASCII text: match on a lowercased copy, splice into the original.
 
-        return text.strip()
+        ASCII lower() keeps every index, so match spans carry over and the
+        text outside a match keeps its case.
+        """
+        lowered = text.lower()
+        suspicious = False
+        for pattern in cls._ASCII_PATTERNS:
+            if pattern.search(lowered) is None:
+                continue
+            suspicious = True
+            pieces: list[str] = []
+            pos = 0
+            for match in pattern.finditer(lowered):
+                pieces.append(text[pos : match.start()])
+                pieces.append("[FILTERED]")
+                pos = match.end()
+            pieces.append(text[pos:])
+            text = "".join(pieces)
+            lowered = text.lower()
+
+        return text.strip(), suspicious
+
+    @classmethod
+    def sanitize(cls, text: str) -> str:
+        """Remove prompt injection patterns and truncate overly long content.
+
+        Applies Unicode normalization before pattern matching to prevent
+        homoglyph-based evasion.
+        """
+        return cls.scan(text)[0]
 
     @classmethod
     def is_suspicious(cls, text: str) -> bool:
@@ -85,4 +141,7 @@ class InputSanitizer:
         if not text:
             return False
         normalized = cls._normalize_unicode(text)
+        if normalized.isascii():
+            lowered = normalized.lower()
+            return any(pattern.search(lowered) for pattern in cls._ASCII_PATTERNS)
         return any(pattern.search(normalized) for pattern in cls._INJECTION_PATTERNS)